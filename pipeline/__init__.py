@@ -20,10 +20,12 @@ from pipeline.steps import (
     StyleRecommendationStep,
     load_products,
 )
+from pipeline.schema_registry import SCHEMA_REGISTRY, CompiledSchema, SchemaRegistry
 
 __all__ = [
     "BaseStep",
     "CATALOG",
+    "CompiledSchema",
     "StepOutput",
     "ITEM_DATA",
     "METADATA",
@@ -35,6 +37,8 @@ __all__ = [
     "Room",
     "RoomRecommendationResponse",
     "RoomRecommendationStep",
+    "SCHEMA_REGISTRY",
+    "SchemaRegistry",
     "Style",
     "StyleRecommendationResponse",
     "StyleRecommendationStep",
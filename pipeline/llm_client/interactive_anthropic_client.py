@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel, ValidationError
 
 from pipeline.llm_client.base_llm_client import BaseLLMClient
 from pipeline.models import LLMRequest, LLMResponse
+from pipeline.schema_registry import SCHEMA_REGISTRY, CompiledSchema
 
 
 class InteractiveAnthropicClient(BaseLLMClient):
@@ -23,6 +27,38 @@ class InteractiveAnthropicClient(BaseLLMClient):
         self.total_output_tokens: int = 0
         self.request_count: int = 0
         self._lock = threading.Lock()
+        self._structured_llms_lock = threading.Lock()
+        self._structured_llms: dict[
+            type[BaseModel], tuple[CompiledSchema, Runnable[Any, Any]]
+        ] = {}
+
+    def _get_structured_llm(
+        self, response_model: type[BaseModel]
+    ) -> tuple[CompiledSchema, Runnable[Any, Any]]:
+        """Return the compiled schema and structured-output runnable for a model.
+
+        Both are built once per client. The runnable is bound to the
+        registry's minimized tool schema, so its parsed output is the
+        decoded tool-call args dict rather than a model.
+
+        Args:
+            response_model: The pydantic response model class.
+
+        Returns:
+            A (compiled_schema, runnable) tuple. The runnable's invoke()
+            returns {"raw", "parsed", "parsing_error"}.
+        """
+        entry = self._structured_llms.get(response_model)
+        if entry is None:
+            with self._structured_llms_lock:
+                entry = self._structured_llms.get(response_model)
+                if entry is None:
+                    compiled = SCHEMA_REGISTRY.get(response_model)
+                    llm = ChatAnthropic(model=self.model)
+                    structured_llm = llm.with_structured_output(compiled.tool, include_raw=True)
+                    entry = (compiled, structured_llm)
+                    self._structured_llms[response_model] = entry
+        return entry
 
     def _send_one(self, index: int, request: LLMRequest) -> tuple[int, LLMResponse]:
         """Send a single LLM request. Returns (index, response) for ordering.
@@ -35,10 +71,7 @@ class InteractiveAnthropicClient(BaseLLMClient):
             A (index, LLMResponse) tuple.
         """
         try:
-            llm = ChatAnthropic(model=self.model)
-            structured_llm = llm.with_structured_output(
-                request.response_model, include_raw=True
-            )
+            compiled, structured_llm = self._get_structured_llm(request.response_model)
             result = structured_llm.invoke(request.prompt)
 
             usage = result["raw"].usage_metadata or {}
@@ -50,12 +83,23 @@ class InteractiveAnthropicClient(BaseLLMClient):
                 self.total_output_tokens += output_tokens
                 self.request_count += 1
 
+            parsed: BaseModel | None = None
+            error: str | None = None
+            if result["parsed"] is None:
+                error = f"No structured output: {result.get('parsing_error')}"
+            else:
+                try:
+                    parsed = compiled.validate_python(result["parsed"])
+                except ValidationError as exc:
+                    error = str(exc)
+
             response = LLMResponse(
                 request=request,
-                parsed=result["parsed"],
+                parsed=parsed,
                 raw_text=str(result["raw"].content) if hasattr(result["raw"], "content") else "",
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                error=error,
             )
         except Exception as exc:
             with self._lock:
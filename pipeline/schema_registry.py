@@ -0,0 +1,145 @@
+"""Per-process registry of compiled LLM response schemas.
+
+Each ``response_model`` is compiled once: its JSON schema is derived,
+minimized (titles and descriptions stripped) for use as the tool schema
+sent with every request, and paired with a cached ``TypeAdapter`` used to
+validate LLM output.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+# JSON schema keywords whose values are subschemas. Only these positions are
+# walked; data-valued keywords (default, const, enum, examples, ...) are copied
+# unchanged so their contents are never altered.
+_SUBSCHEMA_KEYS = frozenset({
+    "items", "additionalItems", "additionalProperties", "contains", "not",
+    "if", "then", "else", "propertyNames", "unevaluatedItems", "unevaluatedProperties",
+})
+_SUBSCHEMA_LIST_KEYS = frozenset({"anyOf", "allOf", "oneOf", "prefixItems"})
+# Keys inside these maps are field/definition names, not keywords, so a
+# field called "title" or "description" must survive minimization.
+_NAMED_SUBSCHEMA_KEYS = frozenset({
+    "properties", "$defs", "definitions", "patternProperties", "dependentSchemas",
+})
+_VERBOSE_KEYS = frozenset({"title", "description"})
+
+
+def _minimize(schema: Any) -> Any:
+    """Recursively drop titles and descriptions from a JSON schema."""
+    if not isinstance(schema, dict):
+        return schema
+    minimized: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key in _VERBOSE_KEYS:
+            continue
+        if key in _NAMED_SUBSCHEMA_KEYS and isinstance(value, dict):
+            minimized[key] = {name: _minimize(sub) for name, sub in value.items()}
+        elif key in _SUBSCHEMA_LIST_KEYS and isinstance(value, list):
+            minimized[key] = [_minimize(sub) for sub in value]
+        elif key == "items" and isinstance(value, list):
+            minimized[key] = [_minimize(sub) for sub in value]
+        elif key in _SUBSCHEMA_KEYS:
+            minimized[key] = _minimize(value)
+        else:
+            minimized[key] = value
+    return minimized
+
+
+class CompiledSchema:
+    """A response model with its schemas and validators derived once."""
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.json_schema: dict[str, Any] = model.model_json_schema()
+        self.minimized_schema: dict[str, Any] = _minimize(self.json_schema)
+        self.tool: dict[str, Any] = {
+            "name": model.__name__,
+            "input_schema": self.minimized_schema,
+        }
+        self.adapter: TypeAdapter[BaseModel] = TypeAdapter(model)
+
+    def validate_python(self, data: Any) -> BaseModel:
+        """Validate an already-decoded object (e.g. tool call args).
+
+        Raises:
+            ValidationError: If the data does not match the model.
+        """
+        return self.adapter.validate_python(data)
+
+    def validate_json(self, payload: str | bytes) -> BaseModel:
+        """Parse and validate a raw JSON payload in a single pass.
+
+        Parsing happens inside pydantic-core, skipping a ``json.loads``
+        round trip through Python objects.
+
+        Raises:
+            ValidationError: If the payload is not valid JSON for the model.
+        """
+        return self.adapter.validate_json(payload)
+
+    def validate_many(
+        self, payloads: list[str | bytes]
+    ) -> list[tuple[BaseModel | None, str | None]]:
+        """Validate many raw JSON payloads, preserving input order.
+
+        This is a plain loop over validate_json() and adds no speed beyond
+        it. Each payload is validated on its own, so one bad result never
+        discards or shifts the rest.
+
+        Args:
+            payloads: Raw JSON documents, one per LLM result.
+
+        Returns:
+            A list of (parsed, error) pairs parallel with payloads. Exactly
+            one of the two is set in each pair.
+        """
+        results: list[tuple[BaseModel | None, str | None]] = []
+        for payload in payloads:
+            try:
+                results.append((self.validate_json(payload), None))
+            except ValidationError as exc:
+                results.append((None, str(exc)))
+        return results
+
+    def __repr__(self) -> str:
+        return f"CompiledSchema(model={self.model.__name__})"
+
+
+class SchemaRegistry:
+    """Thread-safe cache of CompiledSchema keyed by response model."""
+
+    def __init__(self) -> None:
+        self._compiled: dict[type[BaseModel], CompiledSchema] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: type[BaseModel]) -> CompiledSchema:
+        """Return the compiled schema for a model, compiling it on first use.
+
+        Args:
+            model: The pydantic response model class.
+
+        Returns:
+            The cached CompiledSchema for the model.
+        """
+        compiled = self._compiled.get(model)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(model)
+                if compiled is None:
+                    compiled = CompiledSchema(model)
+                    self._compiled[model] = compiled
+        return compiled
+
+    def __contains__(self, model: object) -> bool:
+        return model in self._compiled
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+
+SCHEMA_REGISTRY = SchemaRegistry()
@@ -0,0 +1,134 @@
+"""Tests for InteractiveAnthropicClient with the API call patched out."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from pipeline.llm_client import InteractiveAnthropicClient
+from pipeline.models import (
+    LLMRequest,
+    Room,
+    RoomRecommendationResponse,
+    Style,
+    StyleRecommendationResponse,
+)
+from pipeline.schema_registry import SCHEMA_REGISTRY
+
+# Tool-call args returned by the fake model, keyed by prompt. A missing
+# entry means the model answered without calling the tool.
+TOOL_ARGS: dict[str, dict[str, Any]] = {
+    "good room": {"rooms": [{"name": "Kitchen", "reasoning": "sturdy"}]},
+    "bad room": {"rooms": "not a list"},
+    "good style": {
+        "styles": [{"name": "Scandi", "color_palette": ["white"], "reasoning": "light"}]
+    },
+}
+
+
+@pytest.fixture
+def sent_tools(monkeypatch: pytest.MonkeyPatch) -> list[list[dict[str, Any]]]:
+    """Patch ChatAnthropic._generate and record the tools sent with each call."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    calls: list[list[dict[str, Any]]] = []
+
+    def fake_generate(
+        self: ChatAnthropic, messages: list[BaseMessage], stop: Any = None,
+        run_manager: Any = None, **kwargs: Any,
+    ) -> ChatResult:
+        calls.append(kwargs["tools"])
+        tool = kwargs["tools"][0]["name"]
+        args = TOOL_ARGS.get(str(messages[-1].content))
+        tool_calls = [] if args is None else [{"name": tool, "args": args, "id": "call_1"}]
+        message = AIMessage(
+            content="",
+            tool_calls=tool_calls,
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    monkeypatch.setattr(ChatAnthropic, "_generate", fake_generate)
+    return calls
+
+
+def test_sends_minimized_tool_schema(sent_tools: list[list[dict[str, Any]]]) -> None:
+    client = InteractiveAnthropicClient()
+    client.get_llm_responses(
+        [LLMRequest(prompt="good room", response_model=RoomRecommendationResponse)]
+    )
+    compiled = SCHEMA_REGISTRY.get(RoomRecommendationResponse)
+    assert sent_tools == [[compiled.tool]]
+    assert compiled.tool["input_schema"] == compiled.minimized_schema
+
+
+def test_builds_one_runnable_per_model(
+    sent_tools: list[list[dict[str, Any]]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    built: list[Any] = []
+    original = ChatAnthropic.with_structured_output
+
+    def spy(self: ChatAnthropic, schema: Any, **kwargs: Any) -> Any:
+        built.append(schema)
+        return original(self, schema, **kwargs)
+
+    monkeypatch.setattr(ChatAnthropic, "with_structured_output", spy)
+    client = InteractiveAnthropicClient()
+    requests = [
+        LLMRequest(prompt="good room", response_model=RoomRecommendationResponse)
+        for _ in range(4)
+    ] + [
+        LLMRequest(prompt="good style", response_model=StyleRecommendationResponse)
+        for _ in range(3)
+    ]
+    client.get_llm_responses(requests)
+    client.get_llm_responses(requests)
+    assert len(sent_tools) == 14
+    assert sorted(schema["name"] for schema in built) == [
+        "RoomRecommendationResponse",
+        "StyleRecommendationResponse",
+    ]
+
+
+def test_parses_valid_tool_args(sent_tools: list[list[dict[str, Any]]]) -> None:
+    client = InteractiveAnthropicClient()
+    [room, style] = client.get_llm_responses([
+        LLMRequest(prompt="good room", response_model=RoomRecommendationResponse),
+        LLMRequest(prompt="good style", response_model=StyleRecommendationResponse),
+    ])
+    assert room.error is None
+    assert room.parsed == RoomRecommendationResponse(
+        rooms=[Room(name="Kitchen", reasoning="sturdy")]
+    )
+    assert style.error is None
+    assert style.parsed == StyleRecommendationResponse(
+        styles=[Style(name="Scandi", color_palette=["white"], reasoning="light")]
+    )
+
+
+def test_invalid_tool_args_report_error_and_count_tokens(
+    sent_tools: list[list[dict[str, Any]]],
+) -> None:
+    client = InteractiveAnthropicClient()
+    [response] = client.get_llm_responses(
+        [LLMRequest(prompt="bad room", response_model=RoomRecommendationResponse)]
+    )
+    assert response.parsed is None
+    assert response.error
+    assert (response.input_tokens, response.output_tokens) == (10, 5)
+    assert client.get_token_usage() == 15
+    assert client.request_count == 1
+
+
+def test_missing_tool_call_reports_error(sent_tools: list[list[dict[str, Any]]]) -> None:
+    client = InteractiveAnthropicClient()
+    [response] = client.get_llm_responses(
+        [LLMRequest(prompt="no tool call", response_model=RoomRecommendationResponse)]
+    )
+    assert response.parsed is None
+    assert response.error
+    assert client.get_token_usage() == 15
+    assert client.request_count == 1
@@ -0,0 +1,93 @@
+"""Tests for the compiled response-schema registry."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from pipeline.models import Room, RoomRecommendationResponse
+from pipeline.schema_registry import SchemaRegistry, _minimize
+
+
+class Article(BaseModel):
+    """An article with fields named like schema keywords."""
+
+    title: str = Field(description="The article title.")
+    description: str
+    meta: dict[str, str] = Field(default={"title": "kept", "description": "kept"})
+
+
+def test_minimize_drops_titles_and_descriptions() -> None:
+    schema = _minimize(RoomRecommendationResponse.model_json_schema())
+    assert "title" not in schema
+    assert "description" not in schema
+    room = schema["$defs"]["Room"]
+    assert "title" not in room
+    assert "description" not in room
+    assert room["properties"]["name"] == {"type": "string"}
+    assert room["required"] == ["name", "reasoning"]
+
+
+def test_minimize_keeps_fields_named_title_and_description() -> None:
+    schema = _minimize(Article.model_json_schema())
+    assert set(schema["properties"]) == {"title", "description", "meta"}
+    assert schema["properties"]["title"] == {"type": "string"}
+    assert schema["required"] == ["title", "description"]
+
+
+def test_minimize_leaves_data_values_untouched() -> None:
+    schema = _minimize(Article.model_json_schema())
+    assert schema["properties"]["meta"]["default"] == {"title": "kept", "description": "kept"}
+
+    schema = _minimize({
+        "anyOf": [{"type": "string", "title": "A"}, {"const": {"title": "x"}}],
+        "enum": [{"description": "y"}],
+        "examples": [{"title": "z"}],
+    })
+    assert schema == {
+        "anyOf": [{"type": "string"}, {"const": {"title": "x"}}],
+        "enum": [{"description": "y"}],
+        "examples": [{"title": "z"}],
+    }
+
+
+def test_registry_compiles_once() -> None:
+    registry = SchemaRegistry()
+    compiled = registry.get(RoomRecommendationResponse)
+    assert registry.get(RoomRecommendationResponse) is compiled
+    assert RoomRecommendationResponse in registry
+    assert len(registry) == 1
+    assert registry.get(RoomRecommendationResponse).adapter is compiled.adapter
+    assert compiled.tool == {
+        "name": "RoomRecommendationResponse",
+        "input_schema": compiled.minimized_schema,
+    }
+
+
+def test_validate_many_preserves_order_and_pairs_errors() -> None:
+    compiled = SchemaRegistry().get(RoomRecommendationResponse)
+    payloads: list[str | bytes] = [
+        '{"rooms": [{"name": "Kitchen", "reasoning": "r1"}]}',
+        '{"rooms": "not a list"}',
+        b'{"rooms": [{"name": "Office", "reasoning": "r2"}]}',
+        "not json",
+    ]
+    results = compiled.validate_many(payloads)
+    assert len(results) == len(payloads)
+    assert results[0] == (
+        RoomRecommendationResponse(rooms=[Room(name="Kitchen", reasoning="r1")]),
+        None,
+    )
+    assert results[1][0] is None and results[1][1]
+    assert results[2] == (
+        RoomRecommendationResponse(rooms=[Room(name="Office", reasoning="r2")]),
+        None,
+    )
+    assert results[3][0] is None and results[3][1]
+
+
+def test_validate_many_does_not_merge_adjacent_payloads() -> None:
+    compiled = SchemaRegistry().get(RoomRecommendationResponse)
+    payloads: list[str | bytes] = ['{"rooms":[]},{"rooms":[]', '"extra":1}']
+    results = compiled.validate_many(payloads)
+    assert [parsed for parsed, _ in results] == [None, None]
+    assert all(error for _, error in results)